@@ -119,6 +119,13 @@ class AlertHistory:
 
 class AlertConfig:
     """Configuration for system monitoring thresholds with dynamic adjustment."""
+    __slots__ = (
+        'cpu_threshold', 'memory_threshold', 'storage_latency_threshold',
+        'buffer_threshold', 'check_interval', 'alert_suppression',
+        'rate_limit_interval', 'alert_history_size', 'threshold_history',
+        'adjustment_window'
+    )
+
     def __init__(self, cpu_threshold: float = 80.0,
                  memory_threshold: float = 512.0,  # MB
                  storage_latency_threshold: float = 0.1,  # seconds
@@ -105,6 +105,7 @@ import logging
 import threading
 import time
 import asyncio
+from collections import Counter, deque
 from typing import Dict, List, Optional, Set, Callable, Union, Any
 from typing_extensions import Tuple
 from dataclasses import dataclass, field as dataclass_field
@@ -129,9 +130,9 @@ class ComponentState(enum.Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StateTransitionEvent:
-    """Information about a component state transition."""
+    """Information about a component state transition (immutable record)."""
     component: str
     from_state: ComponentState
     to_state: ComponentState
@@ -205,6 +206,12 @@ class ComponentCoordinator:
         self._state_callbacks: List[Callable[[str, ComponentState, ComponentState], None]] = []
         self._thread_failures: Dict[int, Dict[str, Any]] = {}  # Thread ID -> Failure info
         
+        # Per-component health results, valid until the next system health check
+        # or the end of the current health check interval, whichever is first
+        self._health_epoch = 0
+        self._health_check_interval = 1.0  # seconds
+        self._health_cache: Dict[str, Tuple[Tuple[int, int], bool]] = {}
+        
         # Validate configuration if needed
         if validate and isinstance(config, dict):
             resource_limits = config.get('resource_limits', {})
@@ -333,10 +340,47 @@ class ComponentCoordinator:
                 health_check=health_check,
                 thread_failures=[]  # Initialize thread failure history
             )
+            self._health_cache.pop(name, None)
             
             self.logger.info(f"Registered component: {name}")
             return True
 
+    def get_initialization_order(self) -> List[str]:
+        """Resolve component initialization order from registered dependencies.
+        
+        Uses Kahn's algorithm so each component appears after every registered
+        component it depends on. Dependencies that are not registered are
+        ignored.
+        
+        Returns:
+            List[str]: Component names in initialization order, or an empty
+            list if a dependency cycle is detected
+        """
+        with self._component_lock:
+            in_degree: Dict[str, int] = {}
+            dependents: Dict[str, List[str]] = {name: [] for name in self._components}
+            for name, info in self._components.items():
+                registered = [dep for dep in info.dependencies if dep in dependents]
+                in_degree[name] = len(registered)
+                for dep in registered:
+                    dependents[dep].append(name)
+                    
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: List[str] = []
+        app = order.append  # Local binding avoids attribute lookup in the loop
+        while ready:
+            name = ready.popleft()
+            app(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+                    
+        if len(order) != len(in_degree):
+            self.logger.error("Dependency cycle detected between components")
+            return []
+        return order
+
     def set_resource_limit(self, resource_type: str, limit: int) -> None:
         """Set the limit for a resource type."""
         with self._resource_lock:
@@ -539,6 +583,7 @@ class ComponentCoordinator:
                         info = self._components[component]
                         old_state = info.state
                         info.state = ComponentState.ERROR
+                        self._health_cache.pop(component, None)
                         # Track thread state in component info
                         info.thread_failures.append({
                             'thread_id': thread_id,
@@ -610,10 +655,7 @@ class ComponentCoordinator:
                             
                     # Check for recent thread failures
                     if info.thread_failures:
-                        recent_failures = [
-                            f for f in info.thread_failures 
-                            if time.time() - f['timestamp'] < 300  # Last 5 minutes
-                        ]
+                        recent_failures = self._recent_thread_failures(info)
                         if recent_failures:
                             self.logger.error(
                                 f"Recent thread failures detected for {name}: "
@@ -626,6 +668,56 @@ class ComponentCoordinator:
             except Exception as e:
                 self.logger.error(f"Error verifying system health: {e}")
                 return False
+            finally:
+                # Start a new health epoch so cached component results expire
+                self._health_epoch += 1
+
+    def _recent_thread_failures(self, info: ComponentInfo) -> List[Dict[str, Any]]:
+        """Return thread failures recorded for a component in the last 5 minutes.
+        
+        Caller must hold _component_lock.
+        """
+        now = time.time()
+        return [f for f in info.thread_failures if now - f['timestamp'] < 300]
+
+    def check_component_health(self, component: str) -> bool:
+        """Check the health of a single component.
+        
+        Results are cached for at most one health check interval, and expire
+        early when verify_system_health() completes. Repeated polls within an
+        interval return the cached result instead of re-running the
+        component's health check. A component's cached entry is dropped
+        whenever it transitions, is reset or is affected by a thread failure.
+        
+        Args:
+            component: Name of component to check
+            
+        Returns:
+            bool: True if component is healthy, False otherwise
+        """
+        with self._component_lock:
+            stamp = (self._health_epoch,
+                     int(time.monotonic() // self._health_check_interval))
+            cached = self._health_cache.get(component)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+                
+            info = self._components.get(component)
+            if info is None:
+                self.logger.error(f"Unknown component: {component}")
+                return False
+                
+            healthy = (info.state != ComponentState.ERROR and
+                       not self._recent_thread_failures(info))
+            if healthy and info.health_check:
+                try:
+                    healthy = bool(info.health_check())
+                except Exception as e:
+                    self.logger.error(f"Error in health check for {component}: {e}")
+                    healthy = False
+                    
+            self._health_cache[component] = (stamp, healthy)
+            return healthy
 
     def _monitor_threads(self) -> None:
         """Monitor thread health and detect failures."""
@@ -802,6 +894,7 @@ class ComponentCoordinator:
             
             # Reset to initial state
             info.state = ComponentState.UNINITIALIZED
+            self._health_cache.pop(component, None)
             
             # Record and notify
             self._record_transition(
@@ -855,6 +948,38 @@ class ComponentCoordinator:
             )
             self._state_history.append(event)
             
+        # Invalidate the cached health result; dict.pop is atomic, so this is
+        # safe whether or not the caller holds _component_lock
+        self._health_cache.pop(component, None)
+
+    def analyze_state_history(self) -> Dict[str, Any]:
+        """Summarize recorded state transitions.
+
+        The transition matrix is kept sparse: only observed (from, to) pairs
+        are stored, so memory grows with distinct transitions rather than
+        with the square of the state count.
+
+        Returns:
+            Dict with transition totals, per-component counts and a
+            transition matrix of the form {from_state: {to_state: count}}
+        """
+        with self._history_lock:
+            history = list(self._state_history)
+
+        pair_counts = Counter(
+            (event.from_state.value, event.to_state.value) for event in history
+        )
+        transition_matrix: Dict[str, Dict[str, int]] = {}
+        for (from_state, to_state), count in pair_counts.items():
+            transition_matrix.setdefault(from_state, {})[to_state] = count
+
+        return {
+            'total_transitions': len(history),
+            'failed_transitions': sum(1 for event in history if not event.success),
+            'component_transitions': dict(Counter(event.component for event in history)),
+            'transition_matrix': transition_matrix
+        }
+
     def _notify_state_change(self, component: str, from_state: ComponentState,
                            to_state: ComponentState) -> None:
         """Notify registered callbacks of a state change.
@@ -945,6 +1070,7 @@ class ComponentCoordinator:
                 
                 # Remove component
                 del self._components[component]
+                self._health_cache.pop(component, None)
                 self.logger.info(f"Cleaned up component: {component}")
                 return True
                 
@@ -151,6 +151,28 @@ class WASAPIMonitor:
                 buffer_size=480  # Default 30ms at 16kHz
             )
             
+    @staticmethod
+    def probe() -> bool:
+        """Cheaply check whether the WASAPI host API is available.
+        
+        Does not touch coordinator or stream state, so callers can decide to
+        skip audio work before constructing a monitor. Always returns a bool;
+        errors while releasing PyAudio are logged, not raised.
+        """
+        pa = None
+        try:
+            pa = pyaudio.PyAudio()
+            pa.get_host_api_info_by_type(pyaudio.paWASAPI)
+            return True
+        except Exception:
+            return False
+        finally:
+            if pa is not None:
+                try:
+                    pa.terminate()
+                except Exception as e:
+                    logging.getLogger("WASAPIMonitor").error(f"Error terminating PyAudio after probe: {e}")
+            
     def _handle_state_change(self, old_state: RecoveryState, new_state: RecoveryState) -> None:
         """Handle state machine state changes."""
         try:
@@ -80,8 +80,8 @@ import asyncio
 import logging
 import threading
 import time
-from typing import Dict, Optional, Set, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Any
+from dataclasses import dataclass, replace as dataclass_replace
 from contextlib import contextmanager
 from .component_coordinator import ComponentCoordinator, ComponentState
 from .buffer_manager import BufferManager
@@ -162,6 +162,8 @@ class MonitoringCoordinator(QObject):
         self._active_threads = threading.Event()
         self._active_threads.set()  # Start with threads enabled
         self._shutdown_requested = threading.Event()
+        self._cleanup_complete = threading.Event()  # Set once shutdown cleanup finishes
+        self._monitoring_timer = None  # None when monitoring is not started
         
         # Initialize all locks to prevent deadlocks
         self._state_lock = threading.RLock()  # Reentrant lock for state changes
@@ -173,6 +175,9 @@ class MonitoringCoordinator(QObject):
         self._storage_lock = threading.Lock()  # For storage operations
         self._coordinator_lock = threading.Lock()  # For coordinator access
         
+        # Signalled on every metrics replacement; shares the metrics lock
+        self._metrics_changed = threading.Condition(self._metrics_lock)
+        
         # Thread management with atomic counters
         self._threads: Dict[int, threading.Thread] = {}
         self._next_thread_id = 1
@@ -226,6 +231,35 @@ class MonitoringCoordinator(QObject):
             return self._resource_pool.allocate(size)
         return None
         
+    def allocate_buffers_bulk(self, requests: Iterable[Tuple[int, int]],
+                              use_view: bool = False) -> Optional[List[Any]]:
+        """Allocate a batch of buffers from the resource pool in one call.
+        
+        Each (size, count) request is served with a single tier lock
+        acquisition. The batch is all-or-nothing: if any request cannot be
+        satisfied, buffers already handed out for it are released again.
+        
+        Args:
+            requests: Iterable of (size, count) pairs
+            use_view: Whether to return memory views instead of bytearrays
+            
+        Returns:
+            Allocated buffers in request order, or None if allocation failed
+        """
+        if not self._resource_pool:
+            return None
+            
+        buffers: List[Any] = []
+        for size, count in requests:
+            batch = self._resource_pool.allocate_many(size, count, use_view)
+            if batch is None:
+                self.logger.error(f"Bulk allocation failed for {count} buffers of size {size}")
+                if buffers:
+                    self._resource_pool.release_many(buffers)
+                return None
+            buffers.extend(batch)
+        return buffers
+        
     def release_resource(self, component: str, resource_type: str, resource: Any) -> bool:
         """Release a resource back to its pool.
         
@@ -378,19 +412,38 @@ class MonitoringCoordinator(QObject):
         with self._storage_lock:
             yield
 
+    @contextmanager
+    def all_locks(self):
+        """Context manager holding the state, metrics, perf and coordinator locks.
+        
+        Locks are acquired in hierarchy order (state -> metrics -> perf ->
+        coordinator) within a single with statement, for callers that need a
+        consistent view across all monitoring state.
+        """
+        with self._state_lock, self._metrics_lock, self._perf_lock, self._coordinator_lock:
+            yield
+
     def start_monitoring(self) -> None:
         """Start monitoring with proper synchronization.
         
         This method ensures monitoring is started in a clean state by:
-        1. Setting monitoring flags unconditionally to ensure fresh start
+        1. Setting monitoring flags to ensure fresh start
         2. Creating monitoring timer for test compatibility
         3. Running initial health check to establish baseline system state
-        4. Not checking previous monitoring state to avoid race conditions
+        
+        Calling it again while monitoring is already started is a no-op; the
+        check and the start both happen under _state_lock, so concurrent
+        callers cannot start monitoring twice.
         """
         with self._state_lock:
+            if self._monitoring_timer is not None:
+                self.logger.debug("Monitoring already started")
+                return
+                
             # Set monitoring flags
             self._monitoring_active.set()
             self._active_threads.set()
+            self._cleanup_complete.clear()
             
             # Create monitoring timer for test compatibility
             self._monitoring_timer = True
@@ -407,41 +460,49 @@ class MonitoringCoordinator(QObject):
         This method ensures clean monitoring shutdown by:
         1. Cleaning up existing threads in a deterministic order
         2. Clearing performance stats to prevent stale data
-        3. Removing monitoring timer for test compatibility
+        3. Resetting monitoring timer to None for test compatibility
         4. Clearing monitoring flags last to ensure proper state
         
         The shutdown sequence is important:
         1. Cleanup threads -> Ensures existing operations complete
         2. Clear stats -> Removes any stale monitoring data
-        3. Remove timer -> Ensures proper test state
+        3. Reset timer -> Ensures proper test state
         4. Clear flags -> Ensures proper final state
-        """
-        # Get list of threads to cleanup first
-        thread_ids_to_cleanup = []
-        with self._threads_lock:
-            thread_ids_to_cleanup = list(self._threads.keys())
         
-        # Clean up threads
-        for thread_id in thread_ids_to_cleanup:
-            try:
-                self.unregister_thread(thread_id)
-            except Exception as e:
-                self.logger.error(f"Error unregistering thread {thread_id}: {e}")
-        
-        # Clear performance stats
-        with self._perf_lock:
-            self._performance_stats.clear()
-        
-        # Remove monitoring timer for test compatibility
+        Calling it again after monitoring has stopped is safe: the teardown
+        runs under _state_lock, so concurrent callers are serialized, and a
+        repeated call finds no threads or stats left to clear. Threads that
+        registered before monitoring was started are unregistered as well.
+        """
         with self._state_lock:
-            if hasattr(self, '_monitoring_timer'):
-                delattr(self, '_monitoring_timer')
-        
-        # Clear monitoring flags last to ensure proper final state
-        self._monitoring_active.clear()
-        self._active_threads.clear()
-        
-        self.logger.info("Monitoring stopped")
+            # Get list of threads to cleanup first
+            thread_ids_to_cleanup = []
+            with self._threads_lock:
+                thread_ids_to_cleanup = list(self._threads.keys())
+            
+            # Clean up threads
+            for thread_id in thread_ids_to_cleanup:
+                try:
+                    self.unregister_thread(thread_id)
+                except Exception as e:
+                    self.logger.error(f"Error unregistering thread {thread_id}: {e}")
+            
+            # Clear performance stats
+            with self._perf_lock:
+                self._performance_stats.clear()
+            
+            # Reset monitoring timer sentinel for test compatibility
+            was_started = self._monitoring_timer is not None
+            self._monitoring_timer = None
+            
+            # Clear monitoring flags last to ensure proper final state
+            self._monitoring_active.clear()
+            self._active_threads.clear()
+            
+            if was_started:
+                self.logger.info("Monitoring stopped")
+            else:
+                self.logger.debug("Monitoring already stopped")
 
     def register_thread(self) -> int:
         """Register a thread for monitoring with atomic operations."""
@@ -597,8 +658,24 @@ class MonitoringCoordinator(QObject):
 
     def update_metrics(self, **kwargs) -> None:
         """Update monitoring metrics with enhanced channel awareness and performance tracking."""
-        with self._metrics_lock:
-            try:
+        self.update_metrics_batch((kwargs,))
+
+    def update_metrics_batch(self, samples: Iterable[Mapping[str, Any]]) -> None:
+        """Apply several metric updates with a single metrics lock acquisition.
+        
+        Each sample is a mapping of metric name to value, applied in order as
+        if passed to update_metrics(); later samples win for repeated keys.
+        Only the copy-and-swap of the metrics snapshot runs under _metrics_lock;
+        signal emission and slow-update logging happen after the lock is
+        released so connected slots never run inside the critical section.
+        
+        Args:
+            samples: Metric updates to apply in order
+        """
+        samples = list(samples)
+        metrics_count = sum(len(updates) for updates in samples)
+        try:
+            with self._metrics_lock:
                 # Initialize metrics if needed
                 if not getattr(self, '_metrics_initialized', False):
                     self._metrics = MonitoringMetrics()
@@ -613,15 +690,13 @@ class MonitoringCoordinator(QObject):
                 start_time = time.time()
                 
                 # Create a new metrics instance for atomic update
-                new_metrics = MonitoringMetrics(**{
-                    k: getattr(self._metrics, k) for k in self._metrics.__dataclass_fields__
-                })
+                new_metrics = dataclass_replace(self._metrics)
                 
                 # Track channel health
                 channel_updates = {'left': False, 'right': False}
                 
                 # Update metrics with enhanced validation
-                for key, value in kwargs.items():
+                for key, value in (item for updates in samples for item in updates.items()):
                     # Remove any trailing underscores from metric names
                     clean_key = key.rstrip('_')
                     
@@ -664,7 +739,7 @@ class MonitoringCoordinator(QObject):
                 self._performance_history.append({
                     'timestamp': time.time(),
                     'duration': duration,
-                    'metrics_count': len(kwargs),
+                    'metrics_count': metrics_count,
                     'channel_updates': channel_updates
                 })
                 
@@ -674,27 +749,29 @@ class MonitoringCoordinator(QObject):
                 
                 # Atomic replacement of metrics
                 self._metrics = new_metrics
-                self.update_system_state.emit()
-                
-                # Emit performance stats if significant changes
-                if duration > 0.1:  # Log slow updates
-                    self.logger.warning(f"Slow metrics update: {duration:.3f}s for {len(kwargs)} metrics")
-                    self.performance_stats_updated.emit({
-                        'metrics_update': {
-                            'duration': duration,
-                            'count': len(kwargs),
-                            'channels': channel_updates
-                        }
-                    })
+                self._metrics_changed.notify_all()
                 
-            except Exception as e:
-                self.logger.error(f"Error updating metrics: {e}")
-                self.logger.debug("Failed kwargs: %s", kwargs)
-                # Track error in metrics
-                with self._metrics_lock:
-                    if 'metrics_errors' not in self._metrics.error_counts:
-                        self._metrics.error_counts['metrics_errors'] = 0
-                    self._metrics.error_counts['metrics_errors'] += 1
+        except Exception as e:
+            self.logger.error(f"Error updating metrics: {e}")
+            self.logger.debug("Failed samples: %s", samples)
+            # Track error in metrics
+            with self._metrics_lock:
+                self._metrics.error_count += 1
+            return
+            
+        # Notify listeners outside the metrics lock
+        self.update_system_state.emit()
+        
+        # Emit performance stats if significant changes
+        if duration > 0.1:  # Log slow updates
+            self.logger.warning(f"Slow metrics update: {duration:.3f}s for {metrics_count} metrics")
+            self.performance_stats_updated.emit({
+                'metrics_update': {
+                    'duration': duration,
+                    'count': metrics_count,
+                    'channels': channel_updates
+                }
+            })
 
     def get(self, key: str, *args) -> Any:
         """Get a value by key with proper synchronization."""
@@ -725,9 +802,40 @@ class MonitoringCoordinator(QObject):
         with self._metrics_lock:
             return self._metrics
 
+    def snapshot_metrics(self) -> MonitoringMetrics:
+        """Get a private copy of the current metrics.
+        
+        The copy is taken under a single lock acquisition, so callers can read
+        any number of fields afterwards without holding _metrics_lock or
+        seeing a later update part way through.
+        """
+        with self._metrics_lock:
+            return dataclass_replace(self._metrics)
+
+    def wait_for_metrics(self, predicate: Callable[[MonitoringMetrics], bool],
+                        timeout: Optional[float] = None) -> bool:
+        """Block until the current metrics satisfy predicate.
+        
+        Woken by each update_metrics() call instead of polling on a fixed
+        sleep, so callers return as soon as the condition holds.
+        
+        Args:
+            predicate: Function evaluated against the current metrics
+            timeout: Maximum time to wait in seconds, or None to wait forever
+            
+        Returns:
+            bool: True if predicate was satisfied, False on timeout
+        """
+        with self._metrics_changed:
+            return self._metrics_changed.wait_for(lambda: predicate(self._metrics), timeout)
+
     def update_performance_stats(self, component: str,
-                               stats: Dict[str, Any]) -> None:
-        """Update performance statistics with atomic operations and validation."""
+                               stats: Mapping[str, Any]) -> None:
+        """Update performance statistics with atomic operations and validation.
+        
+        stats is treated as read-only, so callers may pass a shared constant
+        such as a MappingProxyType; it is copied once when stored.
+        """
         if not self._monitoring_active.is_set():
             self.logger.warning("Attempted to update stats while monitoring is inactive")
             return
@@ -739,7 +847,7 @@ class MonitoringCoordinator(QObject):
                 
                 if component not in new_stats or new_stats[component].get('stats') != stats:
                     new_stats[component] = {
-                        'stats': stats.copy(),  # Deep copy of stats
+                        'stats': dict(stats),  # Copy of stats
                         'timestamp': time.time(),
                         'update_count': new_stats.get(component, {}).get('update_count', 0) + 1
                     }
@@ -756,10 +864,20 @@ class MonitoringCoordinator(QObject):
                 self.logger.error(f"Error updating performance stats: {e}")
 
     def get_performance_stats(self) -> Dict[str, Dict[str, Any]]:
-        """Get current performance statistics."""
+        """Get current performance statistics.
+        
+        Prefer this over repeated get_component_metrics() calls when checking
+        several components, so the stats lock is taken once.
+        """
         with self._perf_lock:
             return self._performance_stats.copy()
 
+    def get_component_metrics(self, component: str) -> Optional[Dict[str, Any]]:
+        """Get performance statistics for a single component."""
+        with self._perf_lock:
+            entry = self._performance_stats.get(component)
+            return entry.copy() if entry is not None else None
+
     def get_buffer_manager(self) -> Optional[BufferManager]:
         """Get the buffer manager instance with proper synchronization."""
         with self._coordinator_lock:
@@ -901,8 +1019,24 @@ class MonitoringCoordinator(QObject):
             except Exception as e:
                 self.logger.error(f"Error during component cleanup: {e}")
         
+        # Signal waiters that threads and components have been cleaned up
+        self._cleanup_complete.set()
         self.logger.info("Shutdown requested")
 
     def is_shutdown_requested(self) -> bool:
         """Check if shutdown was requested."""
         return self._shutdown_requested.is_set()
+
+    def wait_cleanup_complete(self, timeout: Optional[float] = None) -> bool:
+        """Wait for shutdown cleanup to finish.
+        
+        Returns as soon as request_shutdown() has unregistered threads and
+        cleaned up components, instead of sleeping for a fixed interval.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait forever
+            
+        Returns:
+            bool: True if cleanup completed, False on timeout
+        """
+        return self._cleanup_complete.wait(timeout)
@@ -52,6 +52,8 @@ COMPONENT_NOTES (Updated 2025-02-19):
             "buffer = pool.allocate(4096)",
             "view = pool.allocate(4096, use_view=True)",
             "pool.release(buffer)",
+            "buffers = pool.allocate_many(4096, 4)",
+            "pool.release_many(buffers)",
             "with pool.cleanup_stage(): ..."
         ]
     },
@@ -85,9 +87,9 @@ import logging
 import threading
 import time
 from typing import Dict, List, Optional, Set, Any, Deque
-from dataclasses import dataclass, field as dataclass_field
+from dataclasses import dataclass, asdict, field as dataclass_field
 from collections import deque
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +99,15 @@ class PoolTier(enum.Enum):
     MEDIUM = 64 * 1024  # 64KB
     LARGE = 1024 * 1024  # 1MB
 
+# (size, tier) pairs in ascending size order, resolved once at import
+_TIER_SIZES = tuple((tier.value, tier) for tier in PoolTier)
+
+# Direct tier lookup for power-of-two request sizes up to the largest tier
+_TIER_LUT = {
+    1 << shift: next(tier for tier_size, tier in _TIER_SIZES if (1 << shift) <= tier_size)
+    for shift in range(PoolTier.LARGE.value.bit_length())
+}
+
 @dataclass
 class PoolMetrics:
     """Metrics for a resource pool tier."""
@@ -109,6 +120,18 @@ class PoolMetrics:
     view_count: int = 0   # Track memory view creation
     staged_count: int = 0 # Track staged cleanups
 
+@dataclass(slots=True, frozen=True)
+class TierSnapshot:
+    """Immutable point-in-time copy of a tier's PoolMetrics."""
+    total_allocated: int
+    current_used: int
+    peak_used: int
+    allocation_count: int
+    release_count: int
+    reuse_count: int
+    view_count: int
+    staged_count: int
+
 class ResourcePool:
     """
     Manages tiered resource pools with proper lifecycle and metrics.
@@ -141,6 +164,9 @@ class ResourcePool:
         self.metrics = {
             tier: PoolMetrics() for tier in PoolTier
         }
+        # Cached metrics values, rebuilt by get_metrics() only after changes
+        self._metrics_cache: Optional[Dict[str, Dict[str, int]]] = None
+        self._metrics_dirty = True
         
         # Initialize locks following coordinator's lock hierarchy
         self._state_lock = threading.RLock()     # Lock 1 (reentrant for state changes)
@@ -157,9 +183,10 @@ class ResourcePool:
         self._pools = {
             tier: deque() for tier in PoolTier
         }
-        # Use list for allocated buffers since bytearray is unhashable
-        self._allocated = {
-            tier: [] for tier in PoolTier
+        # Track allocated buffers using dict with id(buffer) as key, since
+        # bytearray is unhashable; gives O(1) identity-based lookup on release
+        self._allocated: Dict[PoolTier, Dict[int, bytearray]] = {
+            tier: {} for tier in PoolTier
         }
         # Track memory views using dict with id(view) as key
         self._views = {
@@ -180,11 +207,12 @@ class ResourcePool:
     def _update_coordinator_metrics(self):
         """Update coordinator with current metrics."""
         if self.coordinator:
-            with self._metrics_lock:
-                self.coordinator.update_state(
-                    resource_pool_metrics=self.get_metrics(),
-                    resource_pool_stats=self.get_pool_stats()
-                )
+            # get_metrics() takes the metrics lock itself; holding it here
+            # deadlocks on the non-reentrant lock
+            self.coordinator.update_state(
+                resource_pool_metrics=self.get_metrics(),
+                resource_pool_stats=self.get_pool_stats()
+            )
         
     def allocate(self, size: int, use_view: bool = False) -> Optional[Any]:
         """
@@ -207,43 +235,79 @@ class ResourcePool:
             return None
             
         with self._tier_locks[tier]:
-            # Check pool limits
-            if self._check_pool_limit(tier):
-                error = f"Pool limit reached for tier {tier.name}"
+            return self._allocate_nolock(tier, use_view)
+            
+    def allocate_many(self, size: int, count: int, use_view: bool = False) -> Optional[List[Any]]:
+        """
+        Allocate several buffers of the same size with one tier lock acquisition.
+        
+        Args:
+            size: Required buffer size in bytes
+            count: Number of buffers to allocate
+            use_view: Whether to return memory views
+            
+        Returns:
+            List of allocated buffers or memory views, or None if the batch could
+            not be fully allocated (any partial allocations are returned to the pool)
+        """
+        tier = self._get_tier_for_size(size)
+        if not tier:
+            error = f"No suitable tier for size {size}"
+            self.logger.error(error)
+            if self.coordinator:
+                self.coordinator.handle_error(RuntimeError(error), "resource_pool")
+            return None
+            
+        buffers = []
+        with self._tier_locks[tier]:
+            for _ in range(count):
+                buffer = self._allocate_nolock(tier, use_view)
+                if buffer is None:
+                    # Roll back so a failed batch does not leak buffers
+                    for allocated in reversed(buffers):
+                        self._release_nolock(tier, allocated, staged=False, is_cleanup_active=False)
+                    return None
+                buffers.append(buffer)
+        return buffers
+        
+    def _allocate_nolock(self, tier: PoolTier, use_view: bool) -> Optional[Any]:
+        """Allocate from a tier. Caller must hold the tier lock."""
+        # Check pool limits
+        if self._check_pool_limit(tier):
+            error = f"Pool limit reached for tier {tier.name}"
+            self.logger.error(error)
+            if self.coordinator:
+                self.coordinator.handle_error(RuntimeError(error), "resource_pool")
+            return None
+            
+        # Try to reuse from pool (LIFO order)
+        reused = bool(self._pools[tier])
+        if reused:
+            buffer = self._pools[tier].pop()
+        else:
+            # Allocate new buffer
+            try:
+                buffer = bytearray(tier.value)
+            except MemoryError as e:
+                error = f"Memory allocation failed for tier {tier.name}"
                 self.logger.error(error)
                 if self.coordinator:
-                    self.coordinator.handle_error(RuntimeError(error), "resource_pool")
+                    self.coordinator.handle_error(e, "resource_pool")
                 return None
                 
-            # Try to reuse from pool (LIFO order)
-            if self._pools[tier]:
-                buffer = self._pools[tier].pop()
-                with self._metrics_lock:
-                    self.metrics[tier].reuse_count += 1
-            else:
-                # Allocate new buffer
-                try:
-                    buffer = bytearray(tier.value)
-                except MemoryError as e:
-                    error = f"Memory allocation failed for tier {tier.name}"
-                    self.logger.error(error)
-                    if self.coordinator:
-                        self.coordinator.handle_error(e, "resource_pool")
-                    return None
-                    
-            # Track allocation
-            self._allocated[tier].append(buffer)
-            self._update_metrics_allocation(tier)
-            
-            # Return memory view if requested
-            if use_view:
-                view = memoryview(buffer)
-                self._views[tier][id(view)] = (view, buffer)
-                with self._metrics_lock:
-                    self.metrics[tier].view_count += 1
-                return view
+        # Track allocation
+        self._allocated[tier][id(buffer)] = buffer
+        
+        # Create memory view if requested
+        view = None
+        if use_view:
+            view = memoryview(buffer)
+            self._views[tier][id(view)] = (view, buffer)
             
-            return buffer
+        # Record reuse, view and allocation counts in one metrics update
+        self._update_metrics_allocation(tier, reused=reused, with_view=use_view)
+        
+        return view if use_view else buffer
             
     def release(self, buffer: Any, staged: bool = False) -> bool:
         """
@@ -271,47 +335,89 @@ class ResourcePool:
             is_cleanup_active = self._cleanup_stage > 0 if staged else False
             
         with self._tier_locks[tier]:
-            # Handle memory view release
-            if isinstance(buffer, memoryview):
-                view_id = id(buffer)
-                if view_id not in self._views[tier]:
-                    error = "Memory view not found"
-                    self.logger.error(error)
-                    if self.coordinator:
-                        self.coordinator.handle_error(RuntimeError(error), "resource_pool")
-                    return False
-                view, actual_buffer = self._views[tier][view_id]
-                del self._views[tier][view_id]
-                buffer = actual_buffer
+            return self._release_nolock(tier, buffer, staged, is_cleanup_active)
             
-            # Find buffer in allocated list
-            try:
-                idx = self._allocated[tier].index(buffer)
-            except ValueError:
-                error = f"Buffer not allocated from tier {tier.name}"
+    def release_many(self, buffers: List[Any], staged: bool = False) -> bool:
+        """
+        Release several buffers, taking each tier lock once per batch.
+        
+        Args:
+            buffers: Buffers or memory views to release
+            staged: Whether this is part of staged cleanup
+            
+        Returns:
+            bool: True if every buffer was released successfully
+        """
+        success = True
+        by_tier: Dict[PoolTier, List[Any]] = {}
+        for buffer in buffers:
+            tier = self._find_buffer_tier(buffer)
+            if not tier:
+                error = "Buffer not found in any tier"
                 self.logger.error(error)
                 if self.coordinator:
                     self.coordinator.handle_error(RuntimeError(error), "resource_pool")
-                return False
-            
-            # Handle staged cleanup
-            if staged and is_cleanup_active:
-                with self._metrics_lock:
-                    self.metrics[tier].staged_count += 1
-                self._pending_releases[tier].append(buffer)
-                return True
+                success = False
+                continue
+            by_tier.setdefault(tier, []).append(buffer)
             
-            # Return to pool (LIFO order)
-            self._allocated[tier].pop(idx)
-            self._pools[tier].append(buffer)  # Use append for LIFO
-            self._update_metrics_release(tier)
+        # Check cleanup stage once for the whole batch
+        with self._state_lock:
+            is_cleanup_active = self._cleanup_stage > 0 if staged else False
             
+        for tier, tier_buffers in by_tier.items():
+            with self._tier_locks[tier]:
+                for buffer in tier_buffers:
+                    if not self._release_nolock(tier, buffer, staged, is_cleanup_active):
+                        success = False
+        return success
+        
+    def _release_nolock(self, tier: PoolTier, buffer: Any, staged: bool,
+                        is_cleanup_active: bool) -> bool:
+        """Release a buffer to its tier. Caller must hold the tier lock."""
+        # Handle memory view release
+        if isinstance(buffer, memoryview):
+            view_id = id(buffer)
+            if view_id not in self._views[tier]:
+                error = "Memory view not found"
+                self.logger.error(error)
+                if self.coordinator:
+                    self.coordinator.handle_error(RuntimeError(error), "resource_pool")
+                return False
+            view, actual_buffer = self._views[tier][view_id]
+            del self._views[tier][view_id]
+            buffer = actual_buffer
+        
+        # Find buffer in allocated buffers
+        if id(buffer) not in self._allocated[tier]:
+            error = f"Buffer not allocated from tier {tier.name}"
+            self.logger.error(error)
+            if self.coordinator:
+                self.coordinator.handle_error(RuntimeError(error), "resource_pool")
+            return False
+        
+        # Handle staged cleanup
+        if staged and is_cleanup_active:
+            with self._metrics_lock:
+                self.metrics[tier].staged_count += 1
+                self._metrics_dirty = True
+            self._pending_releases[tier].append(buffer)
             return True
+        
+        # Return to pool (LIFO order)
+        del self._allocated[tier][id(buffer)]
+        self._pools[tier].append(buffer)  # Use append for LIFO
+        self._update_metrics_release(tier)
+        
+        return True
             
     def _get_tier_for_size(self, size: int) -> Optional[PoolTier]:
         """Determine appropriate tier for requested size."""
-        for tier in PoolTier:
-            if size <= tier.value:
+        tier = _TIER_LUT.get(size)
+        if tier is not None:
+            return tier
+        for tier_size, tier in _TIER_SIZES:
+            if size <= tier_size:
                 return tier
         return None
         
@@ -333,25 +439,37 @@ class ResourcePool:
                     return tier
         else:
             for tier in PoolTier:
-                if buffer in self._allocated[tier]:
+                if id(buffer) in self._allocated[tier]:
                     return tier
         return None
         
-    def _update_metrics_allocation(self, tier: PoolTier) -> None:
-        """Update metrics after allocation with coordinator integration."""
+    def _update_metrics_allocation(self, tier: PoolTier, reused: bool = False,
+                                   with_view: bool = False) -> None:
+        """Update metrics after allocation with coordinator integration.
+        
+        All counters for one allocation are updated under a single metrics
+        lock acquisition; the coordinator is notified after the lock is
+        released.
+        """
         with self._metrics_lock:
             metrics = self.metrics[tier]
             metrics.total_allocated += 1
             metrics.current_used += 1
             metrics.peak_used = max(metrics.peak_used, metrics.current_used)
             metrics.allocation_count += 1
+            if reused:
+                metrics.reuse_count += 1
+            if with_view:
+                metrics.view_count += 1
+            self._metrics_dirty = True
+            update = {
+                f"resource_pool_{tier.name.lower()}_allocated": metrics.total_allocated,
+                f"resource_pool_{tier.name.lower()}_used": metrics.current_used,
+                f"resource_pool_{tier.name.lower()}_peak": metrics.peak_used
+            }
             
-            if self.coordinator:
-                self.coordinator.update_state(**{
-                    f"resource_pool_{tier.name.lower()}_allocated": metrics.total_allocated,
-                    f"resource_pool_{tier.name.lower()}_used": metrics.current_used,
-                    f"resource_pool_{tier.name.lower()}_peak": metrics.peak_used
-                })
+        if self.coordinator:
+            self.coordinator.update_state(**update)
         
     def _update_metrics_release(self, tier: PoolTier) -> None:
         """Update metrics after release with coordinator integration."""
@@ -359,13 +477,32 @@ class ResourcePool:
             metrics = self.metrics[tier]
             metrics.current_used -= 1
             metrics.release_count += 1
+            self._metrics_dirty = True
+            update = {
+                f"resource_pool_{tier.name.lower()}_used": metrics.current_used,
+                f"resource_pool_{tier.name.lower()}_released": metrics.release_count
+            }
             
-            if self.coordinator:
-                self.coordinator.update_state(**{
-                    f"resource_pool_{tier.name.lower()}_used": metrics.current_used,
-                    f"resource_pool_{tier.name.lower()}_released": metrics.release_count
-                })
+        if self.coordinator:
+            self.coordinator.update_state(**update)
         
+    @contextmanager
+    def all_locks(self):
+        """Context manager holding every pool lock.
+        
+        Acquires the state lock, each tier lock in PoolTier order, then the
+        metrics and perf locks. This matches the nesting used at runtime
+        (allocate/release take a tier lock before the metrics lock), so it
+        cannot deadlock against them.
+        """
+        with ExitStack() as stack:
+            stack.enter_context(self._state_lock)
+            for tier in PoolTier:
+                stack.enter_context(self._tier_locks[tier])
+            stack.enter_context(self._metrics_lock)
+            stack.enter_context(self._perf_lock)
+            yield
+
     @contextmanager
     def cleanup_stage(self):
         """Context manager for staged cleanup with proper lock ordering."""
@@ -390,9 +527,7 @@ class ResourcePool:
             with self._tier_locks[tier]:
                 # Release any pending buffers
                 for buffer in self._pending_releases[tier]:
-                    if buffer in self._allocated[tier]:
-                        idx = self._allocated[tier].index(buffer)
-                        self._allocated[tier].pop(idx)
+                    if self._allocated[tier].pop(id(buffer), None) is not None:
                         self._pools[tier].append(buffer)
                         self._update_metrics_release(tier)
                 self._pending_releases[tier].clear()
@@ -413,7 +548,9 @@ class ResourcePool:
                     self._pools[tier].clear()
                     self._allocated[tier].clear()
                     self._pending_releases[tier].clear()
-                    self.metrics[tier] = PoolMetrics()
+                    with self._metrics_lock:
+                        self.metrics[tier] = PoolMetrics()
+                        self._metrics_dirty = True
                     
             if self.coordinator:
                 self.coordinator.update_state(
@@ -426,20 +563,61 @@ class ResourcePool:
                 if self.coordinator:
                     self.coordinator.update_state(cleanup_stage=self._cleanup_stage)
 
+    def reset_metrics(self) -> None:
+        """Reset per-tier metrics without discarding pooled buffers.
+        
+        Unlike cleanup(), pools and outstanding allocations are kept, so
+        callers can start a fresh measurement window without re-allocating
+        tier buffers. current_used carries over the buffers still allocated
+        so later releases keep it consistent.
+        """
+        for tier in PoolTier:
+            with self._tier_locks[tier]:
+                in_use = len(self._allocated[tier])
+                with self._metrics_lock:
+                    self.metrics[tier] = PoolMetrics(current_used=in_use, peak_used=in_use)
+                    self._metrics_dirty = True
+                    
+        if self.coordinator:
+            self.coordinator.update_state(
+                resource_pool_metrics=self.get_metrics(),
+                resource_pool_stats=self.get_pool_stats()
+            )
+
     def get_metrics(self) -> Dict[str, Dict[str, int]]:
-        """Get current metrics for all tiers."""
+        """Get current metrics for all tiers.
+        
+        The per-tier values are cached and only rebuilt after the metrics
+        change; each call returns fresh plain dicts copied from the cache, so
+        callers may serialize or modify the result freely.
+        """
         with self._metrics_lock:
-            return {
-                tier.name: {
-                    'total_allocated': metrics.total_allocated,
-                    'current_used': metrics.current_used,
-                    'peak_used': metrics.peak_used,
-                    'allocation_count': metrics.allocation_count,
-                    'release_count': metrics.release_count,
-                    'reuse_count': metrics.reuse_count,
-                    'view_count': metrics.view_count,
-                    'staged_count': metrics.staged_count
+            if self._metrics_dirty or self._metrics_cache is None:
+                self._metrics_cache = {
+                    tier.name: {
+                        'total_allocated': metrics.total_allocated,
+                        'current_used': metrics.current_used,
+                        'peak_used': metrics.peak_used,
+                        'allocation_count': metrics.allocation_count,
+                        'release_count': metrics.release_count,
+                        'reuse_count': metrics.reuse_count,
+                        'view_count': metrics.view_count,
+                        'staged_count': metrics.staged_count
+                    }
+                    for tier, metrics in self.metrics.items()
                 }
+                self._metrics_dirty = False
+            return {name: dict(values) for name, values in self._metrics_cache.items()}
+
+    def snapshot(self) -> Dict[str, TierSnapshot]:
+        """Get current metrics for all tiers as immutable slotted records.
+        
+        Fields are read as attributes (snapshot()['SMALL'].staged_count)
+        rather than through nested dict lookups.
+        """
+        with self._metrics_lock:
+            return {
+                tier.name: TierSnapshot(**asdict(metrics))
                 for tier, metrics in self.metrics.items()
             }
 
@@ -107,10 +107,14 @@ import numpy as np
 import gc
 import psutil
 import time
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Union
 from typing_extensions import Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
+
+# Performance-stats keys for buffer tier usage history
+_BUFFER_TIER_KEYS = ('buffer_tier_small', 'buffer_tier_medium', 'buffer_tier_large')
+
 @dataclass
 class AudioStats:
     peak: float
@@ -224,9 +228,18 @@ class SignalProcessor:
             raise ValueError("Memory threshold must be positive")
             
         # Reset performance tracking
-        self.performance_stats['processing_time'].clear()
-        self.performance_stats['queue_size'].clear()
-        self.performance_stats['sync_offsets'].clear()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset performance statistics without reconfiguring the processor.
+        
+        Clears all history lists in place and zeroes the counters, so a
+        long-lived processor can start a fresh measurement window cheaply.
+        """
+        for value in self.performance_stats.values():
+            if isinstance(value, list):
+                value.clear()
+        self.performance_stats['load_average'] = 0.0
         self.performance_stats['dropped_frames'] = 0
         self.performance_stats['recovery_count'] = 0
 
@@ -244,6 +257,7 @@ class SignalProcessor:
         except Exception as e:
             self.coordinator.logger.error(f"Emergency fallback failed: {e}")
             # Return original data split in half as absolute fallback
+            data = bytes(data)
             mid = len(data) // 2
             return data[:mid], data[mid:]
 
@@ -263,11 +277,12 @@ class SignalProcessor:
             if self.coordinator:
                 self.coordinator.handle_error(e, "signal_processor")
 
-    def process_channels(self, data: bytes) -> Tuple[bytes, bytes]:
+    def process_channels(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[bytes, bytes]:
         """Process stereo audio data into separate channels using vectorized operations.
         
         Args:
-            data: Raw stereo audio data
+            data: Raw stereo audio data (any C-contiguous buffer; memoryviews
+                  are read in place without an intermediate bytes copy)
             
         Returns:
             Tuple of (left_channel, right_channel) audio data
@@ -278,8 +293,13 @@ class SignalProcessor:
             start_time = time.perf_counter()
             
             # Calculate buffer sizes
-            view = memoryview(data).cast('h')  # Assuming 16-bit audio
-            length = len(view) // 2
+            nbytes = memoryview(data).nbytes
+            if nbytes % 4:
+                self.coordinator.logger.error(
+                    f"Input of {nbytes} bytes is not aligned to 16-bit stereo frames"
+                )
+                return self.emergency_fallback(data)
+            length = nbytes // 4  # Stereo frames, assuming 16-bit audio
             buffer_size = length * 2
             
             # Allocate buffers through ResourcePool with error tracking
@@ -352,17 +372,13 @@ class SignalProcessor:
             try:
                 # Use numpy's vectorized operations with memory tracking
                 with self.memory_check():
-                    buffer = np.frombuffer(data, dtype=np.int16).reshape(-1, 2)
-                    left = np.frombuffer(left_buffer, dtype=np.int16)
-                    right = np.frombuffer(right_buffer, dtype=np.int16)
+                    buffer = np.frombuffer(data, dtype=np.int16, count=length * 2).reshape(-1, 2)
+                    left = np.frombuffer(left_buffer, dtype=np.int16, count=length)
+                    right = np.frombuffer(right_buffer, dtype=np.int16, count=length)
                     
-                    # Vectorized channel separation with memory monitoring
-                    with np.nditer([buffer[:, 0], buffer[:, 1], left, right], 
-                                 op_flags=[['readonly'], ['readonly'], 
-                                         ['writeonly'], ['writeonly']]) as it:
-                        for l_in, r_in, l_out, r_out in it:
-                            l_out[...] = l_in
-                            r_out[...] = r_in
+                    # Vectorized channel separation: strided slice copies into pooled buffers
+                    left[:] = buffer[:, 0]
+                    right[:] = buffer[:, 1]
                     
                     # Get the channel data as bytes
                     left_data = left.tobytes()
@@ -421,7 +437,7 @@ class SignalProcessor:
                 def process_channel(channel_data: np.ndarray) -> Tuple[bytes, AudioStats]:
                     try:
                         # Allocate buffer through coordinator
-                        buffer = self.coordinator.allocate_resource('signal_processor', 'buffer', len(channel_data.tobytes()))
+                        buffer = self.coordinator.allocate_resource('signal_processor', 'buffer', channel_data.nbytes)
                         if not buffer:
                             return self.emergency_fallback(channel_data.tobytes())[0], None
                         
@@ -843,8 +859,7 @@ class SignalProcessor:
             self.performance_stats['buffer_tier_large'].append(buffer_size)
             
         # Trim buffer usage history
-        for tier in ['small', 'medium', 'large']:
-            key = f'buffer_tier_{tier}'
+        for key in _BUFFER_TIER_KEYS:
             if len(self.performance_stats[key]) > 100:
                 self.performance_stats[key] = self.performance_stats[key][-100:]
                 
@@ -946,13 +961,7 @@ class SignalProcessor:
                 self.coordinator.update_state(cleanup_started=True)
                 
             # Clear performance stats
-            self.performance_stats['processing_time'].clear()
-            self.performance_stats['queue_size'].clear()
-            self.performance_stats['sync_offsets'].clear()
-            self.performance_stats['memory_usage'].clear()
-            self.performance_stats['buffer_tier_small'].clear()
-            self.performance_stats['buffer_tier_medium'].clear()
-            self.performance_stats['buffer_tier_large'].clear()
+            self.reset_stats()
             
             # Reset state
             self.processing_queue_size = 0
@@ -124,9 +124,9 @@ class StateTransition:
     resource_check: Optional[Callable[[], bool]] = None  # Added for resource validation
     component_check: Optional[Callable[[], bool]] = None  # Added for component health
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StateEvent:
-    """Records a state change event with enhanced context."""
+    """Records a state change event with enhanced context (immutable record)."""
     timestamp: float
     from_state: RecoveryState
     to_state: RecoveryState
@@ -217,6 +217,68 @@ class StorageManager:
         
         return results
 
+    def verify_all_paths(self, subdirs: Tuple[str, ...] = ('left', 'right')) -> Dict[str, dict]:
+        """Verify the base path and its subdirectories in one batched pass.
+        
+        Existing directories are discovered with a single os.scandir() of the
+        base path rather than a stat per subdirectory; missing ones are
+        created. Write access is probed with an anonymous O_TMPFILE where the
+        platform supports it, which needs no unlink afterwards.
+        
+        Args:
+            subdirs: Directory names under the base path to verify
+            
+        Returns:
+            Dict mapping 'base' and each subdirectory to its exists/writable result
+        """
+        try:
+            os.makedirs(self.base_path, exist_ok=True)
+            with os.scandir(self.base_path) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except Exception as e:
+            self.logger.error(f"Path verification failed for {self.base_path}: {e}")
+            if self.coordinator:
+                self.coordinator.handle_error(e, "storage_manager")
+            return {name: {'exists': False, 'writable': False} for name in ('base',) + tuple(subdirs)}
+            
+        results = {}
+        try:
+            self._probe_write_access(self.base_path)
+            results['base'] = {'exists': True, 'writable': True}
+        except Exception as e:
+            self.logger.error(f"Path verification failed for base: {e}")
+            results['base'] = {'exists': True, 'writable': False}
+            if self.coordinator:
+                self.coordinator.handle_error(e, "storage_manager")
+                
+        for subdir in subdirs:
+            path = os.path.join(self.base_path, subdir)
+            try:
+                if subdir not in existing:
+                    os.makedirs(path, exist_ok=True)
+                self._probe_write_access(path)
+                results[subdir] = {'exists': True, 'writable': True}
+            except Exception as e:
+                self.logger.error(f"Path verification failed for {subdir}: {e}")
+                results[subdir] = {'exists': os.path.isdir(path), 'writable': False}
+                if self.coordinator:
+                    self.coordinator.handle_error(e, "storage_manager")
+                    
+        return results
+
+    def _probe_write_access(self, path: str) -> None:
+        """Raise if a file cannot be created in path."""
+        if hasattr(os, 'O_TMPFILE'):
+            try:
+                os.close(os.open(path, os.O_TMPFILE | os.O_WRONLY, 0o600))
+                return
+            except OSError:
+                pass  # Filesystem without O_TMPFILE support, use a named file
+        test_file = os.path.join(path, '.write_test')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.remove(test_file)
+
     def write_test_file(self, path: str) -> bool:
         """Write a test file to verify storage access."""
         try:
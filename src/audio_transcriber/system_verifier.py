@@ -93,6 +93,21 @@ from .state_machine import StateMachine
 from .storage_manager import StorageManager
 from .test_config.device_config import DeviceManager, DeviceType
 
+_CHANNELS = ('left', 'right')
+
+# Monitoring state fields recorded in verification results
+_STATE_FIELDS = (
+    'stream_health', 'recovery_attempts', 'error_count',
+    'buffer_size', 'cpu_usage', 'memory_usage'
+)
+
+# Storage subdirectories verified in one batched pass: the directories
+# covered by StorageManager.verify_paths() plus the per-channel recordings
+_STORAGE_DIRS = ('emergency_backup', 'logs', 'backup') + _CHANNELS
+
+# Fixed verification paths, built once at import
+_RESULTS_DIR = Path('tests/results')
+
 class SystemVerifier:
     """Verifies system state and functionality after restart."""
 
@@ -111,6 +126,7 @@ class SystemVerifier:
         self.storage_manager = StorageManager("recordings")  # Base path for recordings
         self.cleanup_coordinator = CleanupCoordinator(self.monitoring_coordinator)
         self.recovery_logger = RecoveryLogger("logs")
+        self._wasapi = None  # Shared by audio checks, created on first use
 
     def run_verification(self) -> bool:
         """Run all verification checks."""
@@ -122,8 +138,16 @@ class SystemVerifier:
             # Run verification tests
             self._verify_component_initialization()
             self._verify_device_availability()
-            self._verify_audio_capture()
-            self._verify_recovery_system()
+            if WASAPIMonitor.probe():
+                self._verify_audio_capture()
+                self._verify_recovery_system()
+            else:
+                # Fail fast rather than waiting on stream initialization
+                for test_name in ('audio_capture', 'recovery_system'):
+                    self.results['tests'][test_name] = {
+                        'status': 'failed',
+                        'error': 'WASAPI host API not available'
+                    }
             self._verify_storage_system()
             
             # Calculate overall status
@@ -145,6 +169,9 @@ class SystemVerifier:
             
         finally:
             # Clean up
+            if self._wasapi is not None:
+                self._wasapi.cleanup()
+                self._wasapi = None
             self.cleanup_coordinator.request_shutdown()
             self.monitoring_coordinator.stop_monitoring()
             self.device_manager.cleanup()
@@ -162,7 +189,9 @@ class SystemVerifier:
                 'status': 'passed',
                 'details': {
                     'monitoring_active': True,
-                    'initial_state': state.__dict__
+                    'initial_state': {
+                        name: getattr(state, name) for name in _STATE_FIELDS
+                    }
                 }
             }
         except Exception as e:
@@ -202,10 +231,13 @@ class SystemVerifier:
                 'error': str(e)
             }
 
-    def _verify_audio_capture(self):
-        """Verify audio capture functionality."""
-        test_name = 'audio_capture'
-        try:
+    def _get_wasapi(self) -> WASAPIMonitor:
+        """Get the shared WASAPI monitor, initializing its stream on first use.
+        
+        Audio capture and recovery checks share one monitor so the device
+        stream is only opened once per verification run.
+        """
+        if self._wasapi is None:
             wasapi = WASAPIMonitor(self.monitoring_coordinator)
             device_config = self.device_manager.get_config(DeviceType.SYSTEM_LOOPBACK)
             
@@ -214,7 +246,16 @@ class SystemVerifier:
                 device_index=device_config.device_index
             )
             if not success:
+                wasapi.cleanup()
                 raise RuntimeError("Failed to initialize audio stream")
+            self._wasapi = wasapi
+        return self._wasapi
+
+    def _verify_audio_capture(self):
+        """Verify audio capture functionality."""
+        test_name = 'audio_capture'
+        try:
+            self._get_wasapi()
             
             # Let it run briefly
             time.sleep(1.0)
@@ -222,8 +263,6 @@ class SystemVerifier:
             # Get performance metrics
             metrics = self.monitoring_coordinator.get_performance_metrics()
             
-            wasapi.cleanup()
-            
             self.results['tests'][test_name] = {
                 'status': 'passed',
                 'details': {
@@ -241,27 +280,18 @@ class SystemVerifier:
         """Verify recovery system functionality."""
         test_name = 'recovery_system'
         try:
-            wasapi = WASAPIMonitor(self.monitoring_coordinator)
-            device_config = self.device_manager.get_config(DeviceType.SYSTEM_LOOPBACK)
-            
-            # Initialize stream
-            success = wasapi.initialize_stream(
-                device_index=device_config.device_index
-            )
-            if not success:
-                raise RuntimeError("Failed to initialize audio stream")
+            self._get_wasapi()
             
             # Trigger recovery
             self.monitoring_coordinator.update_state(stream_health=False)
-            time.sleep(1.0)
             
-            # Verify recovery
-            state = self.monitoring_coordinator.get_state()
-            if not state.stream_health:
+            # Verify recovery, waking on metrics updates rather than a fixed sleep
+            recovered = self.monitoring_coordinator.wait_for_metrics(
+                lambda metrics: metrics.stream_health, timeout=1.0
+            )
+            if not recovered:
                 raise RuntimeError("Failed to recover stream health")
             
-            wasapi.cleanup()
-            
             self.results['tests'][test_name] = {
                 'status': 'passed',
                 'details': {
@@ -279,21 +309,16 @@ class SystemVerifier:
         """Verify storage system functionality."""
         test_name = 'storage_system'
         try:
-            # Verify storage paths
-            paths = self.storage_manager.verify_paths()
-            
-            # Verify write access
-            test_file = Path('recordings/test_write.tmp')
-            self.storage_manager.write_test_file(test_file)
-            
-            # Clean up test file
-            if test_file.exists():
-                test_file.unlink()
+            # Verify storage paths and write access in one batched pass
+            paths = self.storage_manager.verify_all_paths(_STORAGE_DIRS)
+            if not all(p['exists'] and p['writable'] for p in paths.values()):
+                raise RuntimeError("Storage paths verification failed")
             
             self.results['tests'][test_name] = {
                 'status': 'passed',
                 'details': {
                     'paths_verified': True,
+                    'paths': paths,
                     'write_access': True
                 }
             }
@@ -306,7 +331,7 @@ class SystemVerifier:
     def _save_results(self):
         """Save verification results to file."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        result_file = Path(f'tests/results/restart_verify_{timestamp}.json')
+        result_file = _RESULTS_DIR / f'restart_verify_{timestamp}.json'
         result_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(result_file, 'w') as f:
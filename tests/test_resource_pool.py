@@ -0,0 +1,46 @@
+"""Tests for batched buffer allocation through ResourcePool and MonitoringCoordinator."""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from audio_transcriber.resource_pool import PoolTier, ResourcePool
+
+
+@pytest.fixture
+def pool():
+    """Resource pool backed by a mock coordinator."""
+    return ResourcePool(MagicMock())
+
+
+@pytest.mark.fast
+def test_allocate_many_returns_tier_sized_buffers(pool):
+    buffers = pool.allocate_many(PoolTier.SMALL.value, 3)
+    assert [len(b) for b in buffers] == [PoolTier.SMALL.value] * 3
+
+    # Sizes between tiers round up to the next tier
+    buffers = pool.allocate_many(PoolTier.SMALL.value + 1, 2)
+    assert [len(b) for b in buffers] == [PoolTier.MEDIUM.value] * 2
+
+
+@pytest.mark.fast
+def test_allocate_many_views(pool):
+    views = pool.allocate_many(PoolTier.SMALL.value, 2, use_view=True)
+    assert [v.nbytes for v in views] == [PoolTier.SMALL.value] * 2
+
+
+@pytest.mark.fast
+def test_allocate_buffers_bulk_sizes(pool):
+    pytest.importorskip("PySide6")
+    from audio_transcriber.monitoring_coordinator import MonitoringCoordinator
+
+    coordinator = SimpleNamespace(_resource_pool=pool, logger=logging.getLogger(__name__))
+    buffers = MonitoringCoordinator.allocate_buffers_bulk(
+        coordinator,
+        [(PoolTier.SMALL.value, 5), (PoolTier.MEDIUM.value, 5), (PoolTier.LARGE.value, 5)]
+    )
+    assert [len(b) for b in buffers] == (
+        [PoolTier.SMALL.value] * 5 + [PoolTier.MEDIUM.value] * 5 + [PoolTier.LARGE.value] * 5
+    )